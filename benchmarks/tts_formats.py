@@ -0,0 +1,139 @@
+# benchmarks/tts_formats.py
+"""
+Compare negotiated TTS output formats: bytes on the wire and decode time.
+
+Synthesises the same text in every format through services.tts.stream_speech,
+wraps each chunk in the same JSON envelope /ws sends, and times decoding to
+32-bit float samples. Every format, PCM included, is decoded the same way with
+ffmpeg (when it is on PATH); the reported time is the median of several runs
+minus the median of decoding a single PCM sample, so process startup cancels
+out. This is a relative comparison of codec cost, not the browser's
+decodeAudioData time, which the client logs to the console per response.
+
+    python -m benchmarks.tts_formats --sample-rate 16000 "Hello there, how are you?"
+"""
+import argparse
+import base64
+import json
+import shutil
+import statistics
+import subprocess
+import time
+
+from services import tts
+
+DEFAULT_TEXT = "Hello! I'm Liandrin. Ask me anything about the past, the present or the future."
+DECODE_RUNS = 5
+
+
+def wire_size(audio_bytes: bytes, audio_format: str, sample_rate) -> int:
+    message = {
+        "type": "audio_chunk",
+        "chunk_index": 1,
+        "audio": base64.b64encode(audio_bytes).decode("utf-8"),
+        "format": audio_format,
+        "sample_rate": sample_rate,
+        "is_final": False,
+    }
+    return len(json.dumps(message).encode("utf-8"))
+
+
+def input_args(audio_format: str, sample_rate) -> list:
+    # Headerless PCM needs its layout spelled out; containers are probed.
+    if audio_format == "pcm":
+        return ["-f", "s16le", "-ar", str(sample_rate), "-ac", "1"]
+    return []
+
+
+def ffmpeg_decode_seconds(audio_bytes: bytes, args: list) -> float | None:
+    """Median ffmpeg decode time, or None if ffmpeg can't decode the input."""
+    timings = []
+    for _ in range(DECODE_RUNS):
+        start = time.perf_counter()
+        try:
+            subprocess.run(
+                ["ffmpeg", "-v", "quiet", *args, "-i", "pipe:0", "-f", "f32le", "-ac", "1", "pipe:1"],
+                input=audio_bytes,
+                stdout=subprocess.PIPE,
+                check=True,
+            )
+        except subprocess.CalledProcessError:
+            return None
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def startup_baseline() -> float | None:
+    """Time ffmpeg decoding one PCM sample, i.e. the cost of just launching it."""
+    return ffmpeg_decode_seconds(b"\x00\x00", input_args("pcm", tts.DEFAULT_PCM_SAMPLE_RATE))
+
+
+def run(text: str, sample_rate: int | None):
+    baseline = startup_baseline() if shutil.which("ffmpeg") else None
+    rows = []
+    for audio_format in tts.TTS_FORMATS:
+        negotiated = tts.negotiate_format(audio_format, sample_rate)
+        chunks = []
+        first_chunk = None
+        start = time.perf_counter()
+        for chunk in tts.stream_speech(text, audio_format, sample_rate, f"bench_output.{audio_format}"):
+            if first_chunk is None:
+                first_chunk = time.perf_counter() - start
+            chunks.append(chunk)
+        total = time.perf_counter() - start
+
+        audio_bytes = b"".join(chunks)
+        # PCM is forwarded chunk by chunk, containers once per utterance.
+        pieces = chunks if audio_format == "pcm" else [audio_bytes]
+        decode_ms = None
+        decode_error = False
+        if baseline is not None:
+            decode = ffmpeg_decode_seconds(audio_bytes, input_args(audio_format, negotiated["sample_rate"]))
+            if decode is None:
+                decode_error = True
+            else:
+                decode_ms = max(decode - baseline, 0.0) * 1000
+        rows.append({
+            "format": audio_format,
+            "sample_rate": negotiated["sample_rate"],
+            "chunks": len(pieces),
+            "audio_bytes": len(audio_bytes),
+            "wire_bytes": sum(wire_size(p, audio_format, negotiated["sample_rate"]) for p in pieces),
+            "first_chunk_ms": (first_chunk or 0) * 1000,
+            "synth_ms": total * 1000,
+            "decode_ms": decode_ms,
+            "decode_error": decode_error,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("text", nargs="?", default=DEFAULT_TEXT)
+    parser.add_argument("--sample-rate", type=int, default=None)
+    args = parser.parse_args()
+
+    header = f"{'format':<7}{'rate':>7}{'chunks':>8}{'audio B':>10}{'wire B':>10}{'1st ms':>9}{'synth ms':>10}{'decode ms':>11}"
+    print(header)
+    print("-" * len(header))
+    for row in run(args.text, args.sample_rate):
+        if row["decode_error"]:
+            decode = "error"
+        elif row["decode_ms"] is None:
+            decode = "n/a"
+        else:
+            decode = f"{row['decode_ms']:.1f}"
+        print(
+            f"{row['format']:<7}{str(row['sample_rate'] or '-'):>7}{row['chunks']:>8}"
+            f"{row['audio_bytes']:>10}{row['wire_bytes']:>10}{row['first_chunk_ms']:>9.0f}"
+            f"{row['synth_ms']:>10.0f}{decode:>11}"
+        )
+    print()
+    print(
+        f"decode ms: ffmpeg decode to f32le, median of {DECODE_RUNS} runs minus process startup "
+        "(n/a without ffmpeg, error if ffmpeg couldn't decode that format). Browser decodeAudioData time is logged in the client console."
+    )
+
+
+if __name__ == "__main__":
+    main()
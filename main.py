@@ -152,10 +152,14 @@ async def llm_stream_wrapper(prompt: str, session_history: List[Dict[str, Any]]
         yield "[llm error]"
 
 
-async def llm_tts_pipeline(text: str, websocket: WebSocket, session_id: str = None):
+async def llm_tts_pipeline(text: str, websocket: WebSocket, session_id: str = None, audio_settings: Dict[str, Any] = None):
     logging.info(f"[pipeline] start pipeline for session={session_id} text: {text!r}")
+    audio_settings = audio_settings or tts.negotiate_format()
+    audio_format = audio_settings["format"]
+    sample_rate = audio_settings["sample_rate"]
     tts_queue = asyncio.Queue()
     collected_chunks = []
+    chunk_count = 0
 
     if session_id:
         chat_histories.setdefault(session_id, []).append(
@@ -179,25 +183,49 @@ async def llm_tts_pipeline(text: str, websocket: WebSocket, session_id: str = No
             await tts_queue.put(None)
             logging.info("[pipeline] llm_worker finished")
 
+    async def send_audio(audio_bytes: bytes):
+        nonlocal chunk_count
+        chunk_count += 1
+        b64_audio = base64.b64encode(audio_bytes).decode("utf-8")
+        await websocket.send_json({
+            "type": "audio_chunk",
+            "chunk_index": chunk_count,
+            "audio": b64_audio,
+            "format": audio_format,
+            "sample_rate": sample_rate,
+            "is_final": False
+        })
+        logging.info(f"[pipeline] sent audio chunk #{chunk_count} ({audio_format}, size={len(audio_bytes)} bytes)")
+
     async def tts_worker():
-        chunk_count = 0
         try:
             while True:
                 chunk = await tts_queue.get()
                 if chunk is None:
                     break
                 try:
-                    audio_bytes = tts.speak(chunk)
-                    if audio_bytes:
-                        chunk_count += 1
-                        b64_audio = base64.b64encode(audio_bytes).decode("utf-8")
-                        await websocket.send_json({
-                            "type": "audio_chunk",
-                            "chunk_index": chunk_count,
-                            "audio": b64_audio,
-                            "is_final": False
-                        })
-                        logging.info(f"[pipeline] sent audio chunk #{chunk_count} (size={len(audio_bytes)} bytes)")
+                    if audio_format == "pcm":
+                        # Raw PCM is playable in any slice, so forward it as Murf produces it
+                        # instead of waiting for the whole utterance.
+                        audio_stream = tts.stream_speech(chunk, audio_format, sample_rate)
+                        try:
+                            while True:
+                                audio_bytes = await asyncio.to_thread(next, audio_stream, None)
+                                if audio_bytes is None:
+                                    break
+                                await send_audio(audio_bytes)
+                        finally:
+                            # Release the Murf response if sending fails or the worker is cancelled.
+                            try:
+                                audio_stream.close()
+                            except ValueError:
+                                # Cancelled while a worker thread is still inside next().
+                                logging.warning("[pipeline] TTS stream still running in worker thread, not closed")
+                    else:
+                        # Containers like MP3/OGG/WAV are decoded whole by the client.
+                        audio_bytes = await asyncio.to_thread(tts.speak, chunk, None, audio_format, sample_rate)
+                        if audio_bytes:
+                            await send_audio(audio_bytes)
                 except Exception:
                     logging.exception("[pipeline] TTS error for chunk")
                 finally:
@@ -260,6 +288,21 @@ async def websocket_audio_streaming(websocket: WebSocket):
     )
 
     session_id: str | None = None
+    audio_settings: Dict[str, Any] = tts.negotiate_format()
+
+    async def handle_session_message(parsed: Dict[str, Any]):
+        nonlocal session_id, audio_settings
+        session_id = parsed.get("session_id")
+        logging.info(f"[ws] session_id set from client: {session_id}")
+        chat_histories.setdefault(session_id, chat_histories.get(session_id, []))
+
+        audio_settings = tts.negotiate_format(parsed.get("tts_format"), parsed.get("sample_rate"))
+        logging.info(f"[ws] negotiated TTS output: {audio_settings}")
+        await websocket.send_text(json.dumps({
+            "type": "tts_format",
+            "format": audio_settings["format"],
+            "sample_rate": audio_settings["sample_rate"],
+        }))
 
     def on_turn(self: Type[StreamingClient], event: TurnEvent):
         nonlocal processed_turns, last_turn_time
@@ -286,7 +329,7 @@ async def websocket_audio_streaming(websocket: WebSocket):
                             {"role": "user", "text": text, "ts": time.time()}
                         )
 
-                    future = asyncio.run_coroutine_threadsafe(llm_tts_pipeline(text, websocket, session_id), main_loop)
+                    future = asyncio.run_coroutine_threadsafe(llm_tts_pipeline(text, websocket, session_id, audio_settings), main_loop)
                     scheduled_futures.add(future)
                     logging.info("[ws] scheduled llm_tts_pipeline")
                 except Exception:
@@ -323,9 +366,7 @@ async def websocket_audio_streaming(websocket: WebSocket):
                         try:
                             parsed = json.loads(text_msg)
                             if isinstance(parsed, dict) and parsed.get("type") == "session":
-                                session_id = parsed.get("session_id")
-                                logging.info(f"[ws] session_id set from client: {session_id}")
-                                chat_histories.setdefault(session_id, chat_histories.get(session_id, []))
+                                await handle_session_message(parsed)
                         except Exception:
                             pass
                 elif isinstance(msg, str):
@@ -334,9 +375,7 @@ async def websocket_audio_streaming(websocket: WebSocket):
                     try:
                         parsed = json.loads(msg)
                         if isinstance(parsed, dict) and parsed.get("type") == "session":
-                            session_id = parsed.get("session_id")
-                            logging.info(f"[ws] session_id set from client: {session_id}")
-                            chat_histories.setdefault(session_id, chat_histories.get(session_id, []))
+                            await handle_session_message(parsed)
                     except Exception:
                         pass
                 else:
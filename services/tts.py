@@ -1,13 +1,21 @@
 import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import config   
 from murf import Murf
 from pathlib import Path
 import logging
 import os
 
+try:
+    import audioop
+except ImportError:  # removed in Python 3.13
+    audioop = None
+
 logger = logging.getLogger(__name__)
 
+if audioop is None:
+    logger.warning("audioop not available; PCM TTS will be sent at Murf's native sample rate instead of the client's")
+
 MURF_API_URL = "https://api.murf.ai/v1/speech"
 
 
@@ -15,32 +23,149 @@ UPLOADS_DIR = Path(__file__).resolve().parent.parent / "uploads"
 UPLOADS_DIR.mkdir(exist_ok=True)
 
 
-def speak(text: str, output_file: str = "stream_output.wav"):
+# Output formats the /ws handshake may negotiate, mapped to Murf's `format` value.
+TTS_FORMATS = {
+    "wav": "WAV",
+    "mp3": "MP3",
+    "ogg": "OGG",
+    "pcm": "PCM",
+}
+DEFAULT_TTS_FORMAT = "wav"
+COMPRESSED_FORMATS = ("ogg", "mp3")
+# Rates accepted by text_to_speech.stream (murf SDK 2.3.0 docstring). The
+# non-streaming generate endpoint omits 16000, but only stream is used here.
+MURF_SAMPLE_RATES = (8000, 16000, 24000, 44100, 48000)
+PCM_SAMPLE_WIDTH = 2  # Murf PCM is 16-bit little-endian
+DEFAULT_PCM_SAMPLE_RATE = 24000
+
+
+def negotiate_format(audio_format: str | None = None, sample_rate: Any = None) -> Dict[str, Any]:
     """
-    Convert text to speech using Murf API and save audio in uploads folder.
+    Resolve a client's requested TTS format and sample rate to what can be served.
+
+    Returns the format, the rate to request from Murf and the rate the client
+    will actually receive. Unknown formats fall back to WAV; rates are clamped
+    to the range Murf produces, and rates Murf can't produce exactly are
+    requested at the nearest higher rate and resampled for PCM. Malformed
+    values never raise, they fall back to the defaults.
+    """
+    fmt = audio_format.lower() if isinstance(audio_format, str) and audio_format else DEFAULT_TTS_FORMAT
+    if fmt not in TTS_FORMATS:
+        logger.warning(f"Unsupported TTS format {audio_format!r}, falling back to {DEFAULT_TTS_FORMAT}")
+        fmt = DEFAULT_TTS_FORMAT
+
+    rate = None
+    if sample_rate and not isinstance(sample_rate, bool):
+        try:
+            rate = int(sample_rate)
+        except (TypeError, ValueError, OverflowError):
+            logger.warning(f"Invalid TTS sample rate {sample_rate!r}, using default")
+    if rate is not None and rate <= 0:
+        rate = None
+    if rate is None and fmt == "pcm":
+        # Headerless audio is unplayable unless the client knows its rate, so pin one.
+        rate = DEFAULT_PCM_SAMPLE_RATE
+    if rate is None:
+        return {"format": fmt, "murf_sample_rate": None, "sample_rate": None}
+
+    # Keep the output within what Murf produces so a client can't inflate PCM
+    # chunks by asking for an absurd rate.
+    rate = min(max(rate, MURF_SAMPLE_RATES[0]), MURF_SAMPLE_RATES[-1])
+
+    if rate in MURF_SAMPLE_RATES:
+        murf_rate = rate
+    else:
+        murf_rate = next(r for r in MURF_SAMPLE_RATES if r >= rate)
+
+    # Compressed formats carry their own rate and the browser decoder resamples,
+    # so only PCM is converted to the exact rate the client asked for.
+    output_rate = murf_rate
+    if fmt == "pcm" and murf_rate != rate and audioop is not None:
+        output_rate = rate
+
+    return {"format": fmt, "murf_sample_rate": murf_rate, "sample_rate": output_rate}
+
+
+class PCMResampler:
+    """Incrementally resample 16-bit mono PCM chunks, keeping state across chunk boundaries."""
+
+    def __init__(self, in_rate: int, out_rate: int):
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self._state = None
+        self._remainder = b""
+
+    def process(self, chunk: bytes) -> bytes:
+        data = self._remainder + chunk
+        usable = len(data) - (len(data) % PCM_SAMPLE_WIDTH)
+        data, self._remainder = data[:usable], data[usable:]
+        if not data:
+            return b""
+        if self.in_rate == self.out_rate:
+            return data
+        out, self._state = audioop.ratecv(data, PCM_SAMPLE_WIDTH, 1, self.in_rate, self.out_rate, self._state)
+        return out
+
+
+def stream_speech(
+    text: str,
+    audio_format: str = DEFAULT_TTS_FORMAT,
+    sample_rate: int | None = None,
+    output_file: str | None = None,
+) -> Iterator[bytes]:
+    """
+    Stream text-to-speech audio from Murf chunk by chunk in the negotiated format.
+
+    PCM chunks are aligned to whole samples and resampled on the fly when the
+    requested rate is not one Murf produces natively. Audio is also appended to
+    the file in the uploads folder as it arrives.
     """
     if not config.MURF_API_KEY:
         raise Exception("MURF_API_KEY not configured. Please set it via /set_keys.")
 
-    client = Murf(api_key=config.MURF_API_KEY)
-    file_path = UPLOADS_DIR / output_file
+    negotiated = negotiate_format(audio_format, sample_rate)
+    fmt = negotiated["format"]
+    params = {"format": TTS_FORMATS[fmt]}
+    if negotiated["murf_sample_rate"]:
+        params["sample_rate"] = negotiated["murf_sample_rate"]
+    if fmt == "pcm":
+        params["channel_type"] = "MONO"
 
-   
+    resampler = None
+    if fmt == "pcm" and negotiated["murf_sample_rate"]:
+        resampler = PCMResampler(negotiated["murf_sample_rate"], negotiated["sample_rate"])
+
+    client = Murf(api_key=config.MURF_API_KEY)
+    file_path = UPLOADS_DIR / (output_file or f"stream_output.{fmt}")
     open(file_path, "wb").close()
 
     res = client.text_to_speech.stream(
         text=text,
         voice_id="en-US-ariana",
-        style="Conversational"
+        style="Conversational",
+        **params
     )
 
-    audio_bytes = b""
     for audio_chunk in res:
-        audio_bytes += audio_chunk
+        if resampler:
+            audio_chunk = resampler.process(audio_chunk)
+        if not audio_chunk:
+            continue
         with open(file_path, "ab") as f:
             f.write(audio_chunk)
+        yield audio_chunk
 
-    return audio_bytes
+
+def speak(
+    text: str,
+    output_file: str | None = None,
+    audio_format: str = DEFAULT_TTS_FORMAT,
+    sample_rate: int | None = None,
+):
+    """
+    Convert text to speech using Murf API and save audio in uploads folder.
+    """
+    return b"".join(stream_speech(text, audio_format, sample_rate, output_file))
 
 
 def convert_text_to_speech(text: str, voice_id: str = "en-US-natalie") -> str:
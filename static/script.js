@@ -16,6 +16,13 @@ document.addEventListener("DOMContentLoaded", async () => {
   let audioQueue = [];
   let isPlaying = false;
   const BUFFER_SIZE = 1;
+  const CAPTURE_SAMPLE_RATE = 16000;
+
+  let ttsFormat = "wav";
+  let ttsSampleRate = null;
+  let pcmPlaybackTime = 0;
+  const newAudioStats = () => ({ chunks: 0, wireBytes: 0, audioBytes: 0, decodeMs: [], pending: [] });
+  let audioStats = newAudioStats();
 
   const recordBtn = document.getElementById("recordBtn");
   const cancelBtn = document.getElementById("cancelBtn");
@@ -50,6 +57,48 @@ document.addEventListener("DOMContentLoaded", async () => {
     return s;
   };
 
+  // Compressed audio for slow or metered links, raw PCM for direct low-CPU playback.
+  const chooseTtsFormat = () => {
+    const conn = navigator.connection || navigator.mozConnection || navigator.webkitConnection;
+    const slowLink = conn && (conn.saveData || ["slow-2g", "2g", "3g"].includes(conn.effectiveType));
+    if (!slowLink) return "pcm";
+    const probe = document.createElement("audio");
+    return probe.canPlayType('audio/ogg; codecs="opus"') ? "ogg" : "mp3";
+  };
+
+  // Decodes run concurrently, so wall-clock time is reported per chunk rather than summed,
+  // and only once every decode started for this response has settled.
+  const logAudioStats = async (stats) => {
+    await Promise.allSettled(stats.pending);
+    if (stats.chunks === 0) return;
+    const perChunk = stats.decodeMs.map((ms) => ms.toFixed(1)).join(", ");
+    console.log(
+      `[Client] TTS ${ttsFormat}@${ttsSampleRate || "default"}: ${stats.chunks} chunks, ` +
+      `${stats.wireBytes} bytes on wire (${stats.audioBytes} audio), ` +
+      `decode wall-clock per chunk [${perChunk}] ms`
+    );
+  };
+
+  const pcmToAudioBuffer = (bytes, sampleRate) => {
+    const samples = new Int16Array(bytes.buffer, bytes.byteOffset, bytes.byteLength >> 1);
+    const buffer = audioContext.createBuffer(1, samples.length, sampleRate);
+    const channel = buffer.getChannelData(0);
+    for (let i = 0; i < samples.length; i++) {
+      channel[i] = samples[i] / 0x8000;
+    }
+    return buffer;
+  };
+
+  // PCM arrives in small slices, so schedule them back to back instead of waiting on onended.
+  const schedulePcm = (buffer) => {
+    const src = audioContext.createBufferSource();
+    src.buffer = buffer;
+    src.connect(audioContext.destination);
+    pcmPlaybackTime = Math.max(pcmPlaybackTime, audioContext.currentTime);
+    src.start(pcmPlaybackTime);
+    pcmPlaybackTime += buffer.duration;
+  };
+
   const playNextInQueue = () => {
     if (audioQueue.length === 0) {
       isPlaying = false;
@@ -121,6 +170,10 @@ document.addEventListener("DOMContentLoaded", async () => {
     llmStarted = false;
     audioQueue = [];
     isPlaying = false;
+    pcmPlaybackTime = 0;
+    audioStats = newAudioStats();
+    ttsFormat = chooseTtsFormat();
+    ttsSampleRate = ttsFormat === "pcm" ? CAPTURE_SAMPLE_RATE : null;
 
     try {
       const wsProtocol = window.location.protocol === "https:" ? "wss:" : "ws:";
@@ -129,7 +182,12 @@ document.addEventListener("DOMContentLoaded", async () => {
       socket.onopen = async () => {
         setStatus("Connected. Speak now!", true);
         try {
-          socket.send(JSON.stringify({ type: "session", session_id: sessionId }));
+          socket.send(JSON.stringify({
+            type: "session",
+            session_id: sessionId,
+            tts_format: ttsFormat,
+            sample_rate: ttsSampleRate
+          }));
         } catch (err) {
           console.warn("Failed sending session message:", err);
         }
@@ -137,7 +195,7 @@ document.addEventListener("DOMContentLoaded", async () => {
         try {
           const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
 
-          audioContext = new (window.AudioContext || window.webkitAudioContext)({ sampleRate: 16000 });
+          audioContext = new (window.AudioContext || window.webkitAudioContext)({ sampleRate: CAPTURE_SAMPLE_RATE });
           source = audioContext.createMediaStreamSource(stream);
           processor = audioContext.createScriptProcessor(4096, 1, 1);
 
@@ -168,6 +226,10 @@ document.addEventListener("DOMContentLoaded", async () => {
           if (data.type === "status") {
             setStatus(data.message, true);
           }
+          if (data.type === "tts_format") {
+            ttsFormat = data.format;
+            ttsSampleRate = data.sample_rate;
+          }
           if (data.type === "transcription") {
             if (data.is_final) {
               transcriptBox.innerHTML = `<p class="final-transcript">${data.text}</p>`;
@@ -196,8 +258,20 @@ document.addEventListener("DOMContentLoaded", async () => {
           if (data.type === "audio_chunk") {
             const b64 = normalizeBase64(data.audio || data.audio_data || "");
             if (b64) {
-              const binary = Uint8Array.from(atob(b64), (c) => c.charCodeAt(0)).buffer;
-              audioContext.decodeAudioData(binary).then((buffer) => {
+              const bytes = Uint8Array.from(atob(b64), (c) => c.charCodeAt(0));
+              const stats = audioStats;
+              stats.chunks += 1;
+              stats.wireBytes += event.data.length;
+              stats.audioBytes += bytes.byteLength;
+              const decodeStart = performance.now();
+              if ((data.format || ttsFormat) === "pcm") {
+                const buffer = pcmToAudioBuffer(bytes, data.sample_rate || ttsSampleRate || CAPTURE_SAMPLE_RATE);
+                stats.decodeMs.push(performance.now() - decodeStart);
+                schedulePcm(buffer);
+                return;
+              }
+              const decoded = audioContext.decodeAudioData(bytes.buffer).then((buffer) => {
+                stats.decodeMs.push(performance.now() - decodeStart);
                 audioQueue.push(buffer);
                 if (!isPlaying && audioQueue.length >= BUFFER_SIZE) {
                   playNextInQueue();
@@ -205,10 +279,14 @@ document.addEventListener("DOMContentLoaded", async () => {
               }).catch((err) => {
                 console.error("[Client] decodeAudioData error:", err);
               });
+              stats.pending.push(decoded);
             }
           }
           if (data.type === "audio_complete") {
             setStatus("AI response completed. Continue speaking or stop recording.");
+            const completedStats = audioStats;
+            audioStats = newAudioStats();
+            logAudioStats(completedStats);
             if (!isPlaying && audioQueue.length > 0) {
               setTimeout(() => {
                 if (!isPlaying) playNextInQueue();